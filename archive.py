@@ -0,0 +1,159 @@
+from datetime import datetime, timezone, timedelta
+from flask import current_app
+from sqlalchemy import insert, delete, func, text, bindparam
+from sqlalchemy.orm import joinedload
+from extensions import db
+from models import (
+    Event, Registration, Notification, User,
+    ArchivedEvent, ArchivedRegistration,
+)
+
+
+ARCHIVE_TABLES = (ArchivedEvent.__table__, ArchivedRegistration.__table__)
+
+
+def configure_archive_tables(app):
+    """
+    Apply ARCHIVE_PARTITIONED from the app config to the archive table
+    definitions. Must run before db.create_all().
+    """
+    partition_by = "RANGE (event_date)" if app.config.get("ARCHIVE_PARTITIONED") else None
+    for table in ARCHIVE_TABLES:
+        table.dialect_kwargs["postgresql_partition_by"] = partition_by
+
+
+def _partitioning_active():
+    """
+    True when partitioning is enabled and both archive tables really are
+    partitioned. Tables created before ARCHIVE_PARTITIONED was turned on stay
+    plain, so archiving falls back to ordinary inserts instead of failing.
+    """
+    if not current_app.config.get("ARCHIVE_PARTITIONED"):
+        return False
+    if db.engine.dialect.name != "postgresql":
+        return False
+
+    kinds = dict(db.session.execute(
+        text("SELECT relname, relkind FROM pg_class WHERE relname IN :names")
+        .bindparams(bindparam("names", expanding=True)),
+        {"names": [t.name for t in ARCHIVE_TABLES]},
+    ).all())
+    if any(kinds.get(t.name) != "p" for t in ARCHIVE_TABLES):
+        print("[ARCHIVE] ARCHIVE_PARTITIONED is set but the archive tables are not partitioned; "
+              "archiving into the plain tables. Recreate or migrate them to enable partitioning.")
+        return False
+    return True
+
+
+def _ensure_partitions(years):
+    """Create yearly range partitions for the archive tables."""
+    for table in ARCHIVE_TABLES:
+        for year in years:
+            db.session.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {table.name}_{year} PARTITION OF {table.name} "
+                f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')"
+            ))
+
+
+def _archive_batch(events, partitioned):
+    event_ids = [e.id for e in events]
+    event_dates = {e.id: e.event_date for e in events}
+
+    reg_rows = (
+        db.session.query(Registration, User.name, User.email)
+        .outerjoin(User, User.id == Registration.user_id)
+        .filter(Registration.event_id.in_(event_ids))
+        .all()
+    )
+    notified = dict(
+        db.session.query(Notification.event_id, Notification.sent_at)
+        .filter(Notification.event_id.in_(event_ids))
+        .all()
+    )
+    counts = {}
+    for reg, _, _ in reg_rows:
+        counts[reg.event_id] = counts.get(reg.event_id, 0) + 1
+
+    if partitioned:
+        _ensure_partitions({e.event_date.year for e in events})
+
+    db.session.execute(insert(ArchivedEvent), [
+        {
+            "id": e.id,
+            "event_date": e.event_date,
+            "title": e.title,
+            "description": e.description,
+            "location": e.location,
+            "max_capacity": e.max_capacity,
+            "created_by": e.created_by,
+            "organizer_name": e.organizer.name if e.organizer else None,
+            "registration_count": counts.get(e.id, 0),
+            "notified_at": notified.get(e.id),
+            "created_at": e.created_at,
+        }
+        for e in events
+    ])
+    if reg_rows:
+        db.session.execute(insert(ArchivedRegistration), [
+            {
+                "id": reg.id,
+                "event_date": event_dates[reg.event_id],
+                "user_id": reg.user_id,
+                "event_id": reg.event_id,
+                "user_name": name,
+                "user_email": email,
+                "registered_at": reg.registered_at,
+            }
+            for reg, name, email in reg_rows
+        ])
+
+    db.session.execute(delete(Notification).where(Notification.event_id.in_(event_ids)))
+    db.session.execute(delete(Registration).where(Registration.event_id.in_(event_ids)))
+    db.session.execute(delete(Event).where(Event.id.in_(event_ids)))
+
+
+def archive_past_events():
+    """
+    Move events older than the retention window, with their registrations and
+    notifications, into the archive tables. Each batch is copied and deleted in
+    its own transaction, so a failure leaves earlier batches archived and the
+    rest still in the hot tables.
+    """
+    retention = current_app.config.get("ARCHIVE_RETENTION_DAYS", 90)
+    batch_size = current_app.config.get("ARCHIVE_BATCH_SIZE", 500)
+    cutoff = datetime.now(timezone.utc) - timedelta(days=retention)
+
+    partitioned = _partitioning_active()
+    archived = 0
+    while True:
+        events = (
+            Event.query
+            .options(joinedload(Event.organizer))
+            .filter(Event.event_date < cutoff)
+            .order_by(Event.event_date.asc())
+            .limit(batch_size)
+            .all()
+        )
+        if not events:
+            break
+        try:
+            _archive_batch(events, partitioned)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            print(f"[ARCHIVE] Batch failed, stopping: {e}")
+            break
+        archived += len(events)
+
+    if archived:
+        print(f"[ARCHIVE] Moved {archived} event(s) older than {retention} days to the archive.")
+    return archived
+
+
+def archive_stats():
+    return {
+        "hot_events": db.session.query(func.count(Event.id)).scalar(),
+        "hot_registrations": db.session.query(func.count(Registration.id)).scalar(),
+        "archived_events": db.session.query(func.count(ArchivedEvent.id)).scalar(),
+        "archived_registrations": db.session.query(func.count(ArchivedRegistration.id)).scalar(),
+    }
@@ -32,5 +32,21 @@ class Config:
     SOCKETIO_ASYNC_MODE = "eventlet"
 
     SCHEDULER_API_ENABLED = True
+    # Opt-in: start the background scheduler from create_app (e.g. single-process `flask run`).
+    # Otherwise it is started by `python app.py` or a server hook calling app.start_scheduler().
+    SCHEDULER_AUTOSTART = os.environ.get("SCHEDULER_AUTOSTART", "False").lower() == "true"
+
+    ARCHIVE_RETENTION_DAYS = int(os.environ.get("ARCHIVE_RETENTION_DAYS", 90))
+    ARCHIVE_BATCH_SIZE = int(os.environ.get("ARCHIVE_BATCH_SIZE", 500))
+    ARCHIVE_INTERVAL_HOURS = int(os.environ.get("ARCHIVE_INTERVAL_HOURS", 24))
+    # Range-partition the archive tables by event_date (Postgres only).
+    ARCHIVE_PARTITIONED = os.environ.get("ARCHIVE_PARTITIONED", "False").lower() == "true"
+
+    OUTBOX_DISPATCH_INTERVAL_SECONDS = int(os.environ.get("OUTBOX_DISPATCH_INTERVAL_SECONDS", 5))
+    OUTBOX_BATCH_SIZE = int(os.environ.get("OUTBOX_BATCH_SIZE", 100))
+    OUTBOX_MAX_ATTEMPTS = int(os.environ.get("OUTBOX_MAX_ATTEMPTS", 5))
+    OUTBOX_BACKOFF_SECONDS = int(os.environ.get("OUTBOX_BACKOFF_SECONDS", 10))
+    OUTBOX_RETENTION_HOURS = int(os.environ.get("OUTBOX_RETENTION_HOURS", 24))
+    OUTBOX_FAILED_RETENTION_HOURS = int(os.environ.get("OUTBOX_FAILED_RETENTION_HOURS", 168))
 
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024
\ No newline at end of file
@@ -35,6 +35,8 @@ class Event(db.Model):
     __tablename__ = "events"
     __table_args__ = (
         db.Index("ix_events_event_date", "event_date"),
+        # Archived rows keep their original id, so SQLite must never reuse one.
+        {"sqlite_autoincrement": True},
     )
 
     id = db.Column(db.Integer, primary_key=True)
@@ -74,6 +76,7 @@ class Registration(db.Model):
     __tablename__ = "registrations"
     __table_args__ = (
         db.UniqueConstraint("user_id", "event_id", name="uq_user_event"),
+        {"sqlite_autoincrement": True},
     )
 
     id = db.Column(db.Integer, primary_key=True)
@@ -100,4 +103,91 @@ class Notification(db.Model):
 
     id = db.Column(db.Integer, primary_key=True)
     event_id = db.Column(db.Integer, db.ForeignKey("events.id", ondelete="CASCADE"), nullable=False, unique=True)
-    sent_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
\ No newline at end of file
+    sent_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+
+class ArchivedEvent(db.Model):
+    __tablename__ = "archived_events"
+    __table_args__ = (
+        db.Index("ix_archived_events_created_by", "created_by"),
+    )
+
+    # Primary key includes event_date so the table can be range-partitioned on Postgres
+    # (see archive.configure_archive_tables).
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    event_date = db.Column(db.DateTime, primary_key=True)
+    title = db.Column(db.String(200), nullable=False)
+    description = db.Column(db.Text, nullable=True)
+    location = db.Column(db.String(300), nullable=True)
+    max_capacity = db.Column(db.Integer, nullable=False)
+    created_by = db.Column(db.Integer, nullable=False)
+    organizer_name = db.Column(db.String(120), nullable=True)
+    registration_count = db.Column(db.Integer, nullable=False, default=0)
+    notified_at = db.Column(db.DateTime, nullable=True)
+    created_at = db.Column(db.DateTime, nullable=True)
+    archived_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "location": self.location,
+            "event_date": self.event_date.isoformat(),
+            "max_capacity": self.max_capacity,
+            "created_by": self.created_by,
+            "organizer": self.organizer_name,
+            "registration_count": self.registration_count,
+            "notified_at": self.notified_at.isoformat() if self.notified_at else None,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "archived_at": self.archived_at.isoformat(),
+        }
+
+
+class ArchivedRegistration(db.Model):
+    __tablename__ = "archived_registrations"
+    __table_args__ = (
+        db.Index("ix_archived_registrations_event_id", "event_id"),
+        db.Index("ix_archived_registrations_user_id", "user_id"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    event_date = db.Column(db.DateTime, primary_key=True)
+    user_id = db.Column(db.Integer, nullable=False)
+    event_id = db.Column(db.Integer, nullable=False)
+    user_name = db.Column(db.String(120), nullable=True)
+    user_email = db.Column(db.String(255), nullable=True)
+    registered_at = db.Column(db.DateTime, nullable=True)
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "user_id": self.user_id,
+            "event_id": self.event_id,
+            "event_date": self.event_date.isoformat(),
+            "user_name": self.user_name,
+            "user_email": self.user_email,
+            "registered_at": self.registered_at.isoformat() if self.registered_at else None,
+        }
+
+
+class OutboxStatus(str, enum.Enum):
+    pending = "pending"
+    sent = "sent"
+    failed = "failed"
+
+
+class OutboxMessage(db.Model):
+    __tablename__ = "outbox_messages"
+    __table_args__ = (
+        db.Index("ix_outbox_status_id", "status", "id"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    event_name = db.Column(db.String(100), nullable=False)
+    payload = db.Column(db.JSON, nullable=False)
+    status = db.Column(db.Enum(OutboxStatus), nullable=False, default=OutboxStatus.pending)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    last_error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+    next_attempt_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+    sent_at = db.Column(db.DateTime, nullable=True)
@@ -0,0 +1,199 @@
+import threading
+from datetime import datetime, timezone, timedelta
+from flask import current_app
+from sqlalchemy import delete, func
+from apscheduler.jobstores.base import JobLookupError
+from extensions import db, socketio, scheduler
+from models import OutboxMessage, OutboxStatus
+
+DISPATCH_JOB_ID = "dispatch_outbox"
+
+_wakeup = threading.Event()
+_metrics_lock = threading.Lock()
+_metrics = {
+    "dispatch_runs": 0,
+    "batches": 0,
+    "sent": 0,
+    "retried": 0,
+    "failed": 0,
+    "last_run_at": None,
+    "last_batch_ms": None,
+}
+
+
+def _bump(**deltas):
+    with _metrics_lock:
+        for key, value in deltas.items():
+            _metrics[key] += value
+
+
+def enqueue(event_name, payload):
+    """
+    Stage a Socket.IO message in the current session. It is only delivered
+    once the caller's transaction commits, and is dropped if it rolls back.
+    """
+    msg = OutboxMessage(event_name=event_name, payload=payload)
+    db.session.add(msg)
+    return msg
+
+
+def _claim_batch(after_id, batch_size):
+    # Messages still waiting out a backoff are claimed too, so that later
+    # messages for the same event can be held back behind them. There is one
+    # scheduled dispatcher; SKIP LOCKED only keeps an overlapping run harmless.
+    return (
+        OutboxMessage.query
+        .filter(
+            OutboxMessage.status == OutboxStatus.pending,
+            OutboxMessage.id > after_id,
+        )
+        .order_by(OutboxMessage.id.asc())
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+
+
+def _ordering_key(msg):
+    payload = msg.payload if isinstance(msg.payload, dict) else {}
+    return msg.event_name, payload.get("event_id")
+
+
+def _as_utc(dt):
+    return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt
+
+
+def dispatch_outbox():
+    """
+    Scheduled dispatcher job. Wake-ups that arrive while a run is in progress
+    make it go round again, so nothing committed meanwhile waits a full interval.
+    """
+    while True:
+        _wakeup.clear()
+        _drain()
+        if not _wakeup.is_set():
+            break
+
+
+def wake_dispatcher():
+    """
+    Ask the scheduled dispatcher to run now rather than at its next interval.
+    Called by request handlers after their commit; never does any delivery
+    itself, so it does not add to request latency.
+    """
+    _wakeup.set()
+    try:
+        scheduler.modify_job(DISPATCH_JOB_ID, next_run_time=datetime.now(timezone.utc))
+    except JobLookupError:
+        pass
+
+
+def _drain():
+    """
+    Drain pending outbox messages in batches. Delivery is at-least-once: a
+    message is marked sent after it is emitted, so a failed commit re-sends it.
+    Failed emits are retried with exponential backoff up to OUTBOX_MAX_ATTEMPTS;
+    until then, later messages with the same event name and event_id are held
+    back so clients never see an older payload after a newer one.
+    """
+    cfg = current_app.config
+    batch_size = cfg.get("OUTBOX_BATCH_SIZE", 100)
+    max_attempts = cfg.get("OUTBOX_MAX_ATTEMPTS", 5)
+    backoff = cfg.get("OUTBOX_BACKOFF_SECONDS", 10)
+
+    _bump(dispatch_runs=1)
+    blocked = set()
+    after_id = 0
+    while True:
+        started = datetime.now(timezone.utc)
+        try:
+            batch = _claim_batch(after_id, batch_size)
+        except Exception as e:
+            db.session.rollback()
+            print(f"[OUTBOX] Could not claim batch: {e}")
+            break
+        if not batch:
+            db.session.rollback()
+            break
+
+        sent = retried = failed = 0
+        for msg in batch:
+            key = _ordering_key(msg)
+            if key in blocked:
+                continue
+            if _as_utc(msg.next_attempt_at) > started:
+                blocked.add(key)
+                continue
+            try:
+                socketio.emit(msg.event_name, msg.payload)
+            except Exception as e:
+                msg.attempts += 1
+                msg.last_error = str(e)
+                if msg.attempts >= max_attempts:
+                    msg.status = OutboxStatus.failed
+                    failed += 1
+                else:
+                    delay = backoff * (2 ** (msg.attempts - 1))
+                    msg.next_attempt_at = started + timedelta(seconds=delay)
+                    blocked.add(key)
+                    retried += 1
+                continue
+            msg.attempts += 1
+            msg.status = OutboxStatus.sent
+            msg.sent_at = datetime.now(timezone.utc)
+            sent += 1
+
+        after_id = batch[-1].id
+        try:
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            print(f"[OUTBOX] Commit failed, batch will be retried: {e}")
+            break
+
+        elapsed_ms = (datetime.now(timezone.utc) - started).total_seconds() * 1000
+        _bump(batches=1, sent=sent, retried=retried, failed=failed)
+        with _metrics_lock:
+            _metrics["last_batch_ms"] = round(elapsed_ms, 2)
+
+        if len(batch) < batch_size:
+            break
+
+    with _metrics_lock:
+        _metrics["last_run_at"] = datetime.now(timezone.utc).isoformat()
+
+
+def purge_outbox():
+    """
+    Delete delivered messages older than OUTBOX_RETENTION_HOURS and failed
+    ones older than OUTBOX_FAILED_RETENTION_HOURS.
+    """
+    cfg = current_app.config
+    now = datetime.now(timezone.utc)
+    sent_cutoff = now - timedelta(hours=cfg.get("OUTBOX_RETENTION_HOURS", 24))
+    failed_cutoff = now - timedelta(hours=cfg.get("OUTBOX_FAILED_RETENTION_HOURS", 168))
+    try:
+        db.session.execute(
+            delete(OutboxMessage)
+            .where(OutboxMessage.status == OutboxStatus.sent, OutboxMessage.sent_at < sent_cutoff)
+        )
+        db.session.execute(
+            delete(OutboxMessage)
+            .where(OutboxMessage.status == OutboxStatus.failed, OutboxMessage.created_at < failed_cutoff)
+        )
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        print(f"[OUTBOX] Purge failed: {e}")
+
+
+def outbox_metrics():
+    with _metrics_lock:
+        data = dict(_metrics)
+    counts = dict(
+        db.session.query(OutboxMessage.status, func.count(OutboxMessage.id))
+        .group_by(OutboxMessage.status)
+        .all()
+    )
+    data["queue"] = {s.value: counts.get(s, 0) for s in OutboxStatus}
+    return data
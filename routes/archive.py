@@ -0,0 +1,121 @@
+from datetime import datetime
+from flask import Blueprint, request, jsonify
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from sqlalchemy import and_
+from archive import archive_stats
+from extensions import db
+from models import ArchivedEvent, ArchivedRegistration
+from routes.events import _organizer_required
+
+archive_bp = Blueprint("archive", __name__, url_prefix="/api/archive")
+
+
+def _page_args():
+    try:
+        limit = min(max(int(request.args.get("limit", 50)), 1), 200)
+        offset = max(int(request.args.get("offset", 0)), 0)
+    except (ValueError, TypeError):
+        return None
+    return limit, offset
+
+
+@archive_bp.route("/events", methods=["GET"])
+@jwt_required()
+def archived_events():
+    """Organizer's archived events, newest first. Optional ?from= / ?to= ISO dates."""
+    err = _organizer_required()
+    if err:
+        return err
+
+    page = _page_args()
+    if page is None:
+        return jsonify({"error": "Invalid limit or offset"}), 400
+    limit, offset = page
+
+    user_id = int(get_jwt_identity())
+    query = ArchivedEvent.query.filter_by(created_by=user_id)
+
+    try:
+        if request.args.get("from"):
+            query = query.filter(ArchivedEvent.event_date >= datetime.fromisoformat(request.args["from"]))
+        if request.args.get("to"):
+            query = query.filter(ArchivedEvent.event_date < datetime.fromisoformat(request.args["to"]))
+    except ValueError:
+        return jsonify({"error": "Invalid from/to date format"}), 400
+
+    events = (
+        query
+        .order_by(ArchivedEvent.event_date.desc())
+        .limit(limit)
+        .offset(offset)
+        .all()
+    )
+    return jsonify([e.to_dict() for e in events]), 200
+
+
+@archive_bp.route("/events/<int:event_id>", methods=["GET"])
+@jwt_required()
+def archived_event_detail(event_id):
+    err = _organizer_required()
+    if err:
+        return err
+
+    user_id = int(get_jwt_identity())
+    # Databases created before events used AUTOINCREMENT on SQLite can hold
+    # several archived rows with the same id, so ownership picks the row.
+    event = (
+        ArchivedEvent.query
+        .filter_by(id=event_id, created_by=user_id)
+        .order_by(ArchivedEvent.event_date.desc())
+        .first()
+    )
+    if not event:
+        return jsonify({"error": "Archived event not found"}), 404
+
+    regs = (
+        ArchivedRegistration.query
+        .filter_by(event_id=event_id, event_date=event.event_date)
+        .order_by(ArchivedRegistration.registered_at.asc())
+        .all()
+    )
+    return jsonify({
+        "event": event.to_dict(),
+        "registrations": [r.to_dict() for r in regs],
+        "count": len(regs),
+    }), 200
+
+
+@archive_bp.route("/registrations/my", methods=["GET"])
+@jwt_required()
+def my_archived_registrations():
+    page = _page_args()
+    if page is None:
+        return jsonify({"error": "Invalid limit or offset"}), 400
+    limit, offset = page
+
+    user_id = int(get_jwt_identity())
+    rows = (
+        db.session.query(ArchivedRegistration, ArchivedEvent.title, ArchivedEvent.location)
+        .outerjoin(ArchivedEvent, and_(
+            ArchivedEvent.id == ArchivedRegistration.event_id,
+            ArchivedEvent.event_date == ArchivedRegistration.event_date,
+        ))
+        .filter(ArchivedRegistration.user_id == user_id)
+        .order_by(ArchivedRegistration.event_date.desc())
+        .limit(limit)
+        .offset(offset)
+        .all()
+    )
+    return jsonify([
+        {**r.to_dict(), "title": title, "location": location}
+        for r, title, location in rows
+    ]), 200
+
+
+@archive_bp.route("/stats", methods=["GET"])
+@jwt_required()
+def stats():
+    err = _organizer_required()
+    if err:
+        return err
+    return jsonify(archive_stats()), 200
@@ -230,3 +230,15 @@ def analytics_summary():
             for r in popular
         ],
     }), 200
+
+
+@events_bp.route("/analytics/outbox", methods=["GET"])
+@jwt_required()
+def analytics_outbox():
+    """Notification delivery metrics and outbox queue depth."""
+    err = _organizer_required()
+    if err:
+        return err
+
+    from outbox import outbox_metrics
+    return jsonify(outbox_metrics()), 200
@@ -1,8 +1,9 @@
 from flask import Blueprint, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from sqlalchemy.exc import IntegrityError
-from extensions import db, socketio
+from extensions import db
 from models import Event, Registration
+from outbox import enqueue, wake_dispatcher
 
 registrations_bp = Blueprint("registrations", __name__, url_prefix="/api/registrations")
 
@@ -34,15 +35,16 @@ def register_for_event(event_id):
 
         registration = Registration(user_id=user_id, event_id=event_id)
         db.session.add(registration)
-        db.session.commit()
 
         new_count = current_count + 1
 
-        socketio.emit("update_count", {
+        enqueue("update_count", {
             "event_id": event_id,
             "new_count": new_count,
             "max_capacity": event.max_capacity,
         })
+        db.session.commit()
+        wake_dispatcher()
 
         return jsonify({
             "message": "Successfully Registered",
@@ -75,14 +77,16 @@ def cancel_registration(event_id):
         return jsonify({"error": "Registration not found"}), 404
 
     db.session.delete(reg)
-    db.session.commit()
+    db.session.flush()
 
     new_count = Registration.query.filter_by(event_id=event_id).count()
     event = Event.query.get(event_id)
-    socketio.emit("update_count", {
+    enqueue("update_count", {
         "event_id": event_id,
         "new_count": new_count,
         "max_capacity": event.max_capacity if event else 0,
     })
+    db.session.commit()
+    wake_dispatcher()
 
     return jsonify({"message": "Registration Cancelled"}), 200
\ No newline at end of file